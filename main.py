@@ -20,6 +20,7 @@ ENEMY_SPEED = 3.0
 
 BULLET_SPEED = 10
 TURRET_RANGE = 100
+COVERAGE_TURRETS = 2
 
 SPRITE_IMAGE_SIZE = 128
 SPRITE_SCALING = 0.25
@@ -108,11 +109,15 @@ class Bullet(arcade.Sprite):
         self.angle = math.degrees(angle)
         self.change_x = math.cos(angle) * BULLET_SPEED
         self.change_y = math.sin(angle) * BULLET_SPEED
+        self.dead = False
 
     def update(self):
+        if self.dead:
+            return
         dist_traveled = math.sqrt((self.center_x - self.start_pos[0]) ** 2 + (self.center_y - self.start_pos[1]) ** 2)
         if dist_traveled > TURRET_RANGE:
-            self.remove_from_sprite_lists()
+            self.dead = True
+            return
         self.center_x += self.change_x
         self.center_y += self.change_y
 
@@ -131,11 +136,14 @@ class Enemy(arcade.Sprite):
         self.hit_time = 0
         self.health = 10.0
         self.slow_time = 0
+        self.dead = False
 
     def take_damage(self, damage):
         self.health -= damage
         self.hit_time = 0.10
         self.color = [255, 0, 0]
+        if self.health <= 0:
+            self.dead = True
 
     def become_slow(self):
         self.slow_time = 1
@@ -147,11 +155,12 @@ class Enemy(arcade.Sprite):
         if self.cur_position is None:
             self.cur_position = 0
 
-        if self.health <= 0:
-            self.remove_from_sprite_lists()
+        if self.dead:
+            return
 
+        # Flag for removal; the game compacts its sprite lists once per tick
         if self.arrived:
-            self.remove_from_sprite_lists()
+            self.dead = True
             return
 
         # Where are we
@@ -194,6 +203,15 @@ class Enemy(arcade.Sprite):
                 self.arrived = True
 
 
+def remove_dead(sprite_list):
+    """ Drop every sprite flagged dead in a single pass over the list """
+    alive = [sprite for sprite in sprite_list if not sprite.dead]
+    if len(alive) == len(sprite_list):
+        return
+    sprite_list.clear()
+    sprite_list.extend(alive)
+
+
 def find_in_maze(maze, val):
     found = []
     for row in range(len(maze)):
@@ -275,6 +293,7 @@ class MyGame(arcade.Window):
         self.slow_beams = None
         self.bullet_list = None
         self.slow_bullets = None
+        self.placement = None
         self.maze = None
         self.frame_count = 0
 
@@ -327,6 +346,7 @@ class MyGame(arcade.Window):
         self.slow_bullets = arcade.SpriteList()
         self.setup_maze()
         self.paths = get_paths(self.maze)
+        self.placement = turret_placement_ai.PlacementCandidates(self.wall_list, self.paths, TURRET_RANGE)
         self.setup_turrets()
         self.setup_slow_beams()
         self.enemy_starts = find_in_maze(self.maze, 3)
@@ -345,13 +365,18 @@ class MyGame(arcade.Window):
         self.physics_engine = arcade.PhysicsEngineSimple(self.player,
                                                          self.wall_list)
 
+    def convert_wall(self, wall):
+        """ Take a wall out of the maze and out of the placement candidates """
+        self.wall_list.remove(wall)
+        self.placement.place(wall)
+
     def spawn_turret(self, wall):
         resource = ":resources:images/space_shooter/playerShip1_orange.png"
         turret = Turret(resource, SPRITE_SCALING)
         turret.center_x = wall.center_x
         turret.center_y = wall.center_y
         self.turret_list.append(turret)
-        self.wall_list.remove(wall)
+        self.convert_wall(wall)
 
     def spawn_slow_beam(self, wall):
         resource = ":resources:images/topdown_tanks/tankBody_blue.png"
@@ -359,19 +384,25 @@ class MyGame(arcade.Window):
         turret.center_x = wall.center_x
         turret.center_y = wall.center_y
         self.slow_beams.append(turret)
-        self.wall_list.remove(wall)
+        self.convert_wall(wall)
 
     def setup_turrets(self):
         assert self.wall_list is not None
-        for path in self.paths:
+        for path_index in range(len(self.paths)):
             for i in range(2):
-                placement_wall = turret_placement_ai.min_total_distance(path, self.wall_list, TURRET_RANGE)
+                placement_wall = self.placement.min_total_distance(path_index)
                 self.spawn_turret(placement_wall)
+        # Fill the biggest gaps left in turret coverage across all paths
+        for i in range(COVERAGE_TURRETS):
+            placement_wall = self.placement.max_coverage()
+            if placement_wall is None:
+                break
+            self.spawn_turret(placement_wall)
 
     def setup_slow_beams(self):
         assert self.wall_list is not None
         for i in range(2):
-            placement_wall = turret_placement_ai.diff_slow(self.paths[0], self.paths[1], self.wall_list, TURRET_RANGE)
+            placement_wall = self.placement.diff_slow(0, 1)
             self.spawn_slow_beam(placement_wall)
 
     def spawn_enemy(self, path, position):
@@ -407,6 +438,8 @@ class MyGame(arcade.Window):
         closest_enemy = None
         dist = None
         for enemy in self.enemy_list:
+            if enemy.dead:
+                continue
             if closest_enemy is None:
                 closest_enemy = enemy
             new_dist = math.sqrt((pos[0] - enemy.center_x) ** 2 + (pos[1] - enemy.center_y) ** 2)
@@ -418,13 +451,15 @@ class MyGame(arcade.Window):
         return closest_enemy, dist
 
     def furthest_enemy(self):
-        return max(self.enemy_list, key=lambda e: e.cur_position)
+        return max((e for e in self.enemy_list if not e.dead), key=lambda e: e.cur_position)
 
     def get_furthest_target_in_range(self, pos):
         target = None
         path_index = None
         enemy_list = sorted(self.enemy_list, key=lambda e: e.cur_position, reverse=True)
         for enemy in enemy_list:
+            if enemy.dead:
+                continue
             aim_point = utilities.lead_target(pos, enemy, BULLET_SPEED)
             if aim_point is None:
                 continue
@@ -465,13 +500,17 @@ class MyGame(arcade.Window):
                 bullets.append(bullet)
 
         for bullet in bullets:
+            if bullet.dead:
+                continue
             for enemy in self.enemy_list:
+                if enemy.dead:
+                    continue
                 if arcade.check_for_collision(bullet, enemy):
                     if slow:
                         enemy.become_slow()
                     else:
                         enemy.take_damage(2)
-                    bullet.remove_from_sprite_lists()
+                    bullet.dead = True
 
         bullets.update()
 
@@ -511,6 +550,11 @@ class MyGame(arcade.Window):
         self.update_turrets(delta_time, True)
         self.update_turrets(delta_time)
 
+        # Remove everything that died this tick in one pass per list
+        remove_dead(self.enemy_list)
+        remove_dead(self.bullet_list)
+        remove_dead(self.slow_bullets)
+
         # --- Manage Scrolling ---
 
         # Keep track of if we changed the boundary. We don't want to call the
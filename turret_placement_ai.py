@@ -1,6 +1,8 @@
-import utilities
+import heapq
 import math
 
+import utilities
+
 
 def closest_wall_to_pos(pos, walls):
     closest_wall = None
@@ -30,39 +32,98 @@ def closest_path_to_pos(path, pos):
     return closest_path, best_dist
 
 
-def filter_out_of_range(path, walls, max_range):
-    r = []
-    for wall in walls:
-        c = closest_path_to_pos(path, wall.position)
-        if c[1] < max_range:
-            r.append(wall)
-    return r
+class PlacementCandidates:
+    """
+    Live set of walls that can still become turrets.
 
+    Distances from every wall to every path are measured once up front, so
+    each placement only drops one candidate and adjusts the coverage gains
+    of the walls that shared its newly covered path points.
+    """
 
-def min_total_distance(path, walls, max_range):
-    best_wall = None
-    best_dist = None
-    placement_locs = filter_out_of_range(path, walls, max_range)
-
-    for loc in placement_locs:
-        if best_wall is None:
-            best_wall = loc
-        dist = 0
-        for p in path:
-            dist += utilities.get_dist(loc.position, p)
-        if best_dist is None:
-            best_dist = dist
-        elif dist < best_dist:
-            best_dist = dist
-            best_wall = loc
+    def __init__(self, walls, paths, max_range):
+        self.walls = list(walls)
+        self.paths = paths
+        self.max_range = max_range
+        self.index = {id(wall): i for i, wall in enumerate(self.walls)}
+        self.alive = set(range(len(self.walls)))
 
-    return best_wall
+        # closest[i][p] and total[i][p]: distance from wall i to path p
+        self.closest = []
+        self.total = []
+        # covers[i]: path points (path index, point index) in range of wall i
+        self.covers = []
+        # covered_by[point]: walls that have that point in range
+        self.covered_by = {}
+        for i, wall in enumerate(self.walls):
+            closest = []
+            total = []
+            covers = []
+            for p, path in enumerate(paths):
+                best_dist = None
+                dist_sum = 0
+                for j, point in enumerate(path):
+                    dist = utilities.get_dist(wall.position, point)
+                    dist_sum += dist
+                    if best_dist is None or dist < best_dist:
+                        best_dist = dist
+                    if dist < max_range:
+                        covers.append((p, j))
+                        self.covered_by.setdefault((p, j), []).append(i)
+                closest.append(best_dist)
+                total.append(dist_sum)
+            self.closest.append(closest)
+            self.total.append(total)
+            self.covers.append(covers)
 
+        self.covered = set()
+        self.gain = [len(covers) for covers in self.covers]
+        self.heaps = {}
 
-def diff_slow(slow_path, fast_path, walls, max_range):
-    placement_walls = []
-    for wall in walls:
-        c = closest_path_to_pos(fast_path, wall.position)
-        if c[1] > max_range:
-            placement_walls.append(wall)
-    return min(placement_walls, key=lambda e: utilities.get_dist(e.position, slow_path[0]))
+    def _best(self, key, score, eligible=None):
+        # Heaps are built on first use and pruned lazily as walls are placed
+        heap = self.heaps.get(key)
+        if heap is None:
+            heap = [(score(i), i) for i in self.alive if eligible is None or eligible(i)]
+            heapq.heapify(heap)
+            self.heaps[key] = heap
+        while heap:
+            value, i = heap[0]
+            if i not in self.alive:
+                heapq.heappop(heap)
+            elif value != score(i):
+                heapq.heapreplace(heap, (score(i), i))
+            else:
+                return self.walls[i]
+        return None
+
+    def min_total_distance(self, path_index):
+        """ In-range wall with the smallest summed distance to the path """
+        return self._best(("total", path_index),
+                          lambda i: self.total[i][path_index],
+                          lambda i: self.closest[i][path_index] < self.max_range)
+
+    def diff_slow(self, slow_index, fast_index):
+        """ Wall out of range of the fast path that is closest to the slow path's start """
+        start = self.paths[slow_index][0]
+        return self._best(("slow", slow_index, fast_index),
+                          lambda i: utilities.get_dist(self.walls[i].position, start),
+                          lambda i: self.closest[i][fast_index] > self.max_range)
+
+    def max_coverage(self):
+        """ Wall covering the most path points not yet in range of a turret """
+        wall = self._best(("coverage",), lambda i: -self.gain[i])
+        if wall is None or self.gain[self.index[id(wall)]] == 0:
+            return None
+        return wall
+
+    def place(self, wall):
+        """ Remove a wall from the candidates once it has become a turret """
+        i = self.index[id(wall)]
+        self.alive.discard(i)
+        for point in self.covers[i]:
+            if point in self.covered:
+                continue
+            self.covered.add(point)
+            for other in self.covered_by[point]:
+                self.gain[other] -= 1